@@ -1,20 +1,19 @@
 import os
 import sys
 import platform
-import shutil
 import stat
-import urllib.request
-import json
 import re
 import time
-import hashlib
+import functools
+import itertools
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Iterator
 
-from PySide6.QtCore import Qt, QProcess, QTimer, QSettings, QUrl
-from PySide6.QtGui import QKeySequence, QShortcut, QIcon, QDesktopServices
+from PySide6.QtCore import Qt, QProcess, QTimer, QSettings, QUrl, QObject, QThread, Signal, Slot
+from PySide6.QtGui import QKeySequence, QShortcut, QIcon, QDesktopServices, QTextCursor
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPlainTextEdit,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
     QPushButton, QLabel, QFileDialog, QLineEdit, QMessageBox, QGroupBox, QCheckBox,
     QSpinBox, QFormLayout, QComboBox
 )
@@ -53,26 +52,6 @@ def detect_asset_candidates():
             ("https://github.com/mikf/gallery-dl/releases/latest/download/gallery-dl.bin", "gallery-dl"),
         ]
 
-def sha256sum(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1 << 20), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-def download_file(url: str, dest: Path, expected_sha256: str | None = None, timeout: int = 20):
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    tmp = dest.with_suffix(".tmp")
-    req = urllib.request.Request(url, headers={"User-Agent": f"{APP_NAME} (PySide6)"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp, open(tmp, "wb") as f:
-        shutil.copyfileobj(resp, f)
-    if expected_sha256:
-        got = sha256sum(tmp)
-        if got.lower() != expected_sha256.lower():
-            try: tmp.unlink()
-            finally: raise ValueError(f"Checksum mismatch (got {got[:12]}...)")
-    tmp.replace(dest)
-
 def make_executable(path: Path):
     if sys.platform.startswith("win"):
         return
@@ -89,60 +68,194 @@ def parse_version(text: str) -> str | None:
     m = _re_ver.search(text or "")
     return m.group(1) if m else None
 
-def get_local_version(bin_path: Path) -> str | None:
-    if not bin_path.exists():
-        return None
+_GH_LATEST_URL = "https://api.github.com/repos/mikf/gallery-dl/releases/latest"
+_GH_CACHE_TTL = 6 * 3600
+
+def load_gh_cache(settings: QSettings) -> dict:
+    # Cached as {"url", "etag", "tag", "ts"} to spare the 60 req/hr unauthenticated limit
+    import json
     try:
-        import subprocess
-        out = subprocess.check_output([str(bin_path), "--version"], text=True, timeout=8)
-        return parse_version(out)
+        cache = json.loads(settings.value("gh_latest_cache", "") or "{}")
+        return cache if cache.get("url") == _GH_LATEST_URL else {}
     except Exception:
-        return None
+        return {}
+
+def store_gh_cache(settings: QSettings, etag: str | None, tag: str):
+    import json
+    settings.setValue("gh_latest_cache", json.dumps(
+        {"url": _GH_LATEST_URL, "etag": etag, "tag": tag, "ts": time.time()}
+    ))
 
-def get_latest_version_tag() -> str | None:
-    url = "https://api.github.com/repos/mikf/gallery-dl/releases/latest"
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": f"{APP_NAME} (PySide6)", "Accept": "application/vnd.github+json"},
-    )
+def parse_release_tag(body: bytes) -> str | None:
+    import json
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8", "ignore"))
-            tag = data.get("tag_name") or ""
-            return tag[1:] if tag.startswith("v") else tag
+        tag = json.loads(body.decode("utf-8", "ignore")).get("tag_name") or ""
     except Exception:
         return None
+    return tag[1:] if tag.startswith("v") else tag
+
+_re_digits = re.compile(r"\d+")
+
+@functools.lru_cache(maxsize=16)
+def _version_parts(v: str) -> tuple[int, ...]:
+    return tuple(map(int, _re_digits.findall(v.split("-", 1)[0])))
 
 def is_newer(ver_local: str, ver_remote: str) -> bool:
-    def parts(v: str):
-        main = v.split("-", 1)[0]
-        return [int(x) for x in main.split(".") if x.isdigit()]
-    try:
-        return parts(ver_remote) > parts(ver_local)
-    except Exception:
-        return False
+    return _version_parts(ver_remote) > _version_parts(ver_local)
+
+# -------------------------
+# Log parsing
+# -------------------------
+
+# Output is classified as raw bytes; only the GUI log gets a decoded copy.
+
+# One scan per line: an error marker, or a media file path printed by
+# gallery-dl (Windows drive or POSIX absolute), whichever comes first.
+# Compiled with RE2 when google-re2 is installed (linear-time DFA, no
+# backtracking across the alternatives); the stdlib engine otherwise.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+    _re_opts = {}
+else:
+    # RE2 defaults to UTF-8 and won't match invalid sequences against [^...];
+    # paths come in the console code page (cp932, cp1252, ...), so go bytewise
+    _re2_options = _re_engine.Options()
+    _re2_options.encoding = _re_engine.Options.Encoding.LATIN1
+    _re_opts = {"options": _re2_options}
+
+# Group 1 is the error marker, group 2 the path (numbered: re2 keys names as bytes)
+_re_line = _re_engine.compile(
+    rb'(?i)(error:|http error|forbidden|not found)'
+    rb'|((?:[A-Za-z]:\\[^:*?"<>|\r\n]+|/[^:*?"<>|\r\n]+)'
+    rb'\.(?:jpe?g|png|gif|webp|mp4|webm|mkv|mov|avi)\b)',
+    **_re_opts,
+)
+
+# gallery-dl prints skipped files as "# <path>" (yt-dlp says "has already been
+# downloaded"); a bare path is a completed download
+_re_skip = re.compile(rb"^#\s|has already been downloaded", re.IGNORECASE)
+
+# The error markers alone, for dot-less lines and for the tail of a line whose
+# first hit was a path. Under RE2 a literal alternation becomes a single
+# automaton pass over the bytes (Aho-Corasick style), stopping at the first hit.
+_re_error = _re_engine.compile(rb"(?i)error:|http error|forbidden|not found", **_re_opts)
+
+class LogParser(QObject):
+    """Classifies gallery-dl output off the GUI thread.
+
+    Emits parsed(batch, downloaded, skipped, failed) deltas once per chunk
+    and batch_done(batch) once every chunk queued before finish() has been
+    classified; the seen-path set lives here and resets per batch.
+    """
+    parsed = Signal(int, int, int, int)
+    batch_done = Signal(int)
+
+    def __init__(self):
+        super().__init__()
+        self._seen_paths: set[bytes] = set()
+
+    @Slot()
+    def reset(self):
+        self._seen_paths.clear()
+
+    @Slot(int)
+    def finish(self, batch: int):
+        # queued behind the batch's parse() calls, so its deltas are already out
+        self.batch_done.emit(batch)
+
+    @Slot(int, object)
+    def parse(self, batch: int, data: bytes):
+        d_downloaded = d_skipped = d_failed = 0
+        for raw in data.splitlines():
+            line = raw.strip()
+            if b"." not in line:
+                # no file extension possible; only an error marker can match
+                if _re_error.search(line):
+                    d_failed += 1
+                continue
+
+            m = _re_line.search(line)
+            if not m:
+                continue
+
+            # Count likely errors live (a marker anywhere on the line wins over a path)
+            if m.group(1) is not None or _re_error.search(line, m.start()):
+                d_failed += 1
+                continue
+
+            # Printed path -> downloaded or skipped (based on gallery-dl's skip marker)
+            path = m.group(2)
+            if path in self._seen_paths:
+                continue
+            self._seen_paths.add(path)
+
+            if _re_skip.search(line):
+                d_skipped += 1
+            else:
+                d_downloaded += 1
+
+        if d_downloaded or d_skipped or d_failed:
+            self.parsed.emit(batch, d_downloaded, d_skipped, d_failed)
+
+# -------------------------
+# URL helpers
+# -------------------------
+
+def iter_stripped(lines):
+    """Yield non-empty stripped lines without materializing the input."""
+    return (ln for ln in (raw.strip() for raw in lines) if ln)
+
+def clean_urls(text: str) -> tuple[tuple[str, ...], int, int]:
+    """Parse one-URL-per-line text into (urls, skipped, duplicates), order preserved.
+
+    The result is immutable so it can be cached and shared by callers.
+    """
+    seen = {}  # insertion-ordered; de-duplicates as we go
+    accepted = 0
+    skipped = 0
+    for ln in iter_stripped(text.splitlines()):
+        if ln.startswith("<") and ln.endswith(">"):
+            ln = ln[1:-1].strip()
+        # cheap prefix check first; split("/", 3) then yields the netloc at index 2
+        if not ln[:8].lower().startswith(("http://", "https://")):
+            skipped += 1
+            continue
+        netloc = ln.split("/", 3)[2]
+        if netloc and netloc[0] not in "?#":
+            seen[ln] = None
+            accepted += 1
+        else:
+            skipped += 1
+    return tuple(seen), skipped, accepted - len(seen)
+
+# Test URL parses a single line or selection, so memoizing it is cheap; the
+# whole URL box is parsed uncached (start_run reuses it through _url_cache)
+_clean_test_urls = functools.lru_cache(maxsize=64)(clean_urls)
 
 # -------------------------
 # Styling (Catppuccin Mocha QSS)
 # -------------------------
 
-def apply_styles(app):
-    app.setStyle("Fusion")
-    base      = "#1e1e2e"
-    mantle    = "#181825"
-    crust     = "#11111b"
-    text      = "#cdd6f4"
-    subtext0  = "#a6adc8"
-    overlay0  = "#6c7086"
-    surface0  = "#313244"
-    surface1  = "#45475a"
-    surface2  = "#585b70"
-    blue      = "#89b4fa"
-    red       = "#f38ba8"
-    green     = "#a6e3a1"
-    lavender  = "#b4befe"
-
-    qss = f"""
+_PALETTE = {
+    "base": "#1e1e2e",
+    "mantle": "#181825",
+    "crust": "#11111b",
+    "text": "#cdd6f4",
+    "subtext0": "#a6adc8",
+    "overlay0": "#6c7086",
+    "surface0": "#313244",
+    "surface1": "#45475a",
+    "surface2": "#585b70",
+    "blue": "#89b4fa",
+    "red": "#f38ba8",
+    "green": "#a6e3a1",
+    "lavender": "#b4befe",
+}
+
+# Interpolated once at import; apply_styles only hands the result to Qt
+_QSS = """
     QWidget {{ background: {base}; color: {text}; font-family: "Segoe UI","Inter","Cantarell",sans-serif; font-size: 14px; }}
     QLabel#titleLabel {{ font-size: 20px; font-weight: 800; color: {lavender}; }}
     QLabel#infoLabel {{ color: {subtext0}; font-size: 13px; }}
@@ -151,7 +264,7 @@ def apply_styles(app):
     QGroupBox::title {{ subcontrol-origin: margin; padding: 0 6px; color: {subtext0}; background: transparent; }}
     QLineEdit, QPlainTextEdit, QTextEdit {{ background: {crust}; border: 1px solid {surface1}; border-radius: 10px; padding: 8px 10px; selection-background-color: {blue}; selection-color: #0b0b0b; }}
     QLineEdit:focus, QPlainTextEdit:focus, QTextEdit:focus {{ border: 1px solid {blue}; outline: none; }}
-    QTextEdit#logView, QPlainTextEdit#urlsEdit {{ background: {mantle}; border-color: {surface0}; font-family: "Cascadia Code","Consolas",monospace; font-size: 12px; }}
+    QPlainTextEdit#logView, QPlainTextEdit#urlsEdit {{ background: {mantle}; border-color: {surface0}; font-family: "Cascadia Code","Consolas",monospace; font-size: 12px; }}
     QPushButton {{ background-color: {surface1}; color: {text}; border: 1px solid {surface2}; border-radius: 10px; padding: 8px 14px; font-weight: 600; }}
     QPushButton:hover {{ background-color: {surface2}; border-color: {overlay0}; }}
     QPushButton:pressed {{ background-color: {surface0}; }}
@@ -160,14 +273,21 @@ def apply_styles(app):
     QPushButton#primaryBtn:hover {{ background-color: {green}; border-color: {green}; }}
     QPushButton#dangerBtn {{ background-color: {red}; border: 1px solid {red}; color: #0b0b0b; }}
     QLabel.chip {{ padding: 4px 8px; border-radius: 8px; background: {surface1}; }}
-    """
-    app.setStyleSheet(qss)
+    """.format_map(_PALETTE)
+
+def apply_styles(app):
+    app.setStyle("Fusion")
+    app.setStyleSheet(_QSS)
 
 # -------------------------
 # Main App
 # -------------------------
 
 class Navillera(QWidget):
+    _parse_requested = Signal(int, object)  # (batch, raw stdout bytes) -> LogParser.parse
+    _parse_reset = Signal()
+    _parse_finish = Signal(int)  # batch -> LogParser.finish, after its last chunk
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{APP_NAME} — gallery-dl GUI")
@@ -176,24 +296,58 @@ class Navillera(QWidget):
         self.settings = QSettings(APP_NAME, "gallery-dl")
 
         self.proc: QProcess | None = None
+        self._running: bool = False  # start_run .. All done / stop; spans batch gaps
         self.queue: list[str] = []
         self.bin_path: Path = app_bin_dir() / ("gallery-dl.exe" if sys.platform.startswith("win") else "gallery-dl")
 
         # Stats
-        self._totals = {"downloaded": 0, "skipped": 0, "failed": 0}
+        self._t_downloaded: int = 0
+        self._t_skipped: int = 0
+        self._t_failed: int = 0
+        # (downloaded, skipped, failed, done, total) as currently rendered
+        self._shown_summary: tuple[int, int, int, int, int] = (0, 0, 0, 0, 0)
 
         # Batch tracking
-        self._batch_started_at: float = 0.0
         self._batch_urls: list[str] = []
         self._batch_index: int = -1
-        self._batches: list[list[str]] = []
+        self._batch_iter: Iterator[list[str]] = iter(())  # batches are sliced on demand
+        self._queue_total: int = 0  # len(self.queue), fixed for the run
+        self._common_args: list[str] = []  # built once per run, shared by every batch
+        self._total_batches: int = 0  # number of batches, fixed for the run
+        self._done_urls_prior: int = 0  # URLs in batches before the current one
+        self._batch_token: int = 0  # tags parser deltas; bumped per batch and on stop
 
         # Live helpers
-        self._seen_paths: set[str] = set()
         self._error_lines: int = 0
 
+        # Output classification runs on its own thread
+        self._parser = LogParser()
+        self._parser_thread = QThread(self)
+        self._parser.moveToThread(self._parser_thread)
+        self._parse_requested.connect(self._parser.parse)
+        self._parse_reset.connect(self._parser.reset)
+        self._parse_finish.connect(self._parser.finish)
+        self._parser.parsed.connect(self._on_parsed)
+        self._parser.batch_done.connect(self._on_batch_done)
+        self._parser_thread.start()
+
+        # Coalesce readyRead bursts so each read hands over a larger chunk
+        self._read_timer = QTimer(self)
+        self._read_timer.setSingleShot(True)
+        self._read_timer.setInterval(50)
+        self._read_timer.timeout.connect(self._read_output)
+
+        # Local version cache, keyed by the binary's (mtime, size)
+        # (key, version, --version output)
+        self._local_ver_cache: tuple[str, str | None, str] | None = None
+        self._ver_waiters: list | None = None  # callbacks of the in-flight probe
+
+        # Network (async; never blocks the GUI thread)
+        self.net = QNetworkAccessManager(self)
+        self._fetching: bool = False
+
         # Update throttle (persisted)
-        self._last_update_check = float(self.settings.value("last_update_check_ts", 0.0))
+        self._last_update_check: float = 0.0  # loaded in _load_settings
 
         self._build_ui()
         self._load_settings()
@@ -369,12 +523,33 @@ class Navillera(QWidget):
         self.urls.setObjectName("urlsEdit")
         self.urls.setPlaceholderText("Paste one URL per line. Tip: drag-and-drop .txt files or text here.")
 
+        # Parsed URL list, refreshed while idle (150 ms after the last edit)
+        self._url_cache: tuple[tuple[str, ...], int, int] | None = None
+        self._url_timer = QTimer(self)
+        self._url_timer.setSingleShot(True)
+        self._url_timer.setInterval(150)
+        self._url_timer.timeout.connect(self._refresh_url_cache)
+        self.urls.textChanged.connect(self._on_urls_changed)
+
         log_label = QLabel("Log")
         log_label.setObjectName("sectionLabel")
-        self.log = QTextEdit()
+        self.log = QPlainTextEdit()
         self.log.setObjectName("logView")
         self.log.setReadOnly(True)
-        self.log.document().setMaximumBlockCount(10000)  # keep UI snappy on long runs
+        self.log.setMaximumBlockCount(5000)  # keep UI snappy and memory bounded on long runs
+
+        # Coalesce log lines and flush at most ~60 times per second
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(16)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Stick-to-bottom scrolling, capped at 20 Hz
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(50)
+        self._scroll_timer.timeout.connect(self._scroll_to_bottom)
 
         # Assemble
         root.addLayout(header)
@@ -399,25 +574,128 @@ class Navillera(QWidget):
         self.adv_toggle_btn.setText("Advanced ▾" if expanded else "Advanced ▸")
 
     def _log(self, msg: str):
-        self.log.append(msg)
+        self._log_buf.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        sb = self.log.verticalScrollBar()
+        at_end = sb.value() == sb.maximum()
+        self.log.appendPlainText(text)
+        if at_end and not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    def _scroll_to_bottom(self):
+        sb = self.log.verticalScrollBar()
+        sb.setValue(sb.maximum())
 
     def clear_log(self):
+        self._log_buf.clear()
         self.log.clear()
 
     def bin_present(self) -> bool:
         return self.bin_path.exists()
 
+    def probe_local_version(self, callback):
+        """Call callback(version | None, timed_out) once the local version is known.
+
+        Runs `--version` through an async QProcess so the GUI never blocks, and
+        skips the probe entirely while the binary is unchanged on disk. The
+        result is persisted, keyed by path/mtime/size, so it survives restarts.
+        Callers arriving while a probe is running wait on that same probe. A
+        timeout is not a verdict: version is None and timed_out is True.
+        """
+        if self._ver_waiters is not None:
+            self._ver_waiters.append(callback)
+            return
+        try:
+            st = self.bin_path.stat()
+        except OSError:
+            self._local_ver_cache = None
+            callback(None, False)
+            return
+        key = f"{self.bin_path}|{st.st_mtime!r}|{st.st_size}"
+        if self._local_ver_cache is None and self.settings.value("local_version_key", "") == key:
+            ver = self.settings.value("local_version", "") or None
+            self._local_ver_cache = (key, ver, self.settings.value("local_version_text", "") or ver or "")
+        if self._local_ver_cache and self._local_ver_cache[0] == key:
+            _, ver, text = self._local_ver_cache
+            if text:
+                self.version_line.setText(text)
+            callback(ver, False)
+            return
+
+        self._ver_waiters = [callback]
+        p = QProcess(self)
+        p.setProgram(str(self.bin_path))
+        p.setArguments(["--version"])
+        p.setProcessChannelMode(QProcess.MergedChannels)
+        state = {"finished": False, "timed_out": False}
+
+        def _done(*_):
+            state["finished"] = True
+            out = p.readAllStandardOutput().data().decode(errors="replace").strip()
+            ver = parse_version(out) if p.exitStatus() == QProcess.NormalExit else None
+            if not state["timed_out"]:
+                self._local_ver_cache = (key, ver, out)
+                self.settings.setValue("local_version_key", key)
+                self.settings.setValue("local_version", ver or "")
+                self.settings.setValue("local_version_text", out)
+            if out:
+                self.version_line.setText(out)
+            p.deleteLater()
+            self._settle_version_probe(ver, state["timed_out"])
+
+        def _error(err):
+            # finished() is never emitted when the binary can't be started
+            if err == QProcess.FailedToStart:
+                state["finished"] = True
+                p.deleteLater()
+                self._settle_version_probe(None, False)
+
+        def _timeout():
+            # `--version` answers quickly or not at all
+            if not state["finished"]:
+                state["timed_out"] = True
+                self._log("gallery-dl --version timed out after 3 s.")
+                p.kill()
+
+        p.finished.connect(_done)
+        p.errorOccurred.connect(_error)
+        p.start()
+        QTimer.singleShot(3000, _timeout)
+
+    def _settle_version_probe(self, ver: str | None, timed_out: bool):
+        waiters, self._ver_waiters = self._ver_waiters or [], None
+        for callback in waiters:
+            callback(ver, timed_out)
+
     def show_version_if_present(self):
         if self.bin_present():
-            self._run_once(["--version"], capture_only=True)
+            # log exactly what the version chip shows, cached or freshly probed
+            self.probe_local_version(lambda ver, _: self._log(self.version_line.text()) if ver else None)
         else:
             self.version_line.setText("Not installed")
 
     def _update_summary_labels(self, done: int, total: int):
-        self.sum_downloaded.setText(f"✅ Downloaded: {self._totals['downloaded']}")
-        self.sum_skipped.setText(f"⚠️ Skipped: {self._totals['skipped']}")
-        self.sum_failed.setText(f"❌ Failed: {self._totals['failed']}")
-        self.sum_progress.setText(f"▶️ {done} / {total}")
+        # setText restyles the chip, so only touch labels whose value changed
+        shown = (self._t_downloaded, self._t_skipped, self._t_failed, done, total)
+        last = self._shown_summary
+        if shown == last:
+            return
+        if shown[0] != last[0]:
+            self.sum_downloaded.setText("✅ Downloaded: %d" % shown[0])
+        if shown[1] != last[1]:
+            self.sum_skipped.setText("⚠️ Skipped: %d" % shown[1])
+        if shown[2] != last[2]:
+            self.sum_failed.setText("❌ Failed: %d" % shown[2])
+        if shown[3:] != last[3:]:
+            self.sum_progress.setText("▶️ %d / %d" % shown[3:])
+        self._shown_summary = shown
 
     # ---------- Settings persist ----------
     def _save_settings(self):
@@ -433,30 +711,41 @@ class Navillera(QWidget):
         s.setValue("adv_open", self.adv_panel.isVisible())
         s.setValue("geom", self.saveGeometry())
         s.setValue("last_update_check_ts", self._last_update_check)
+        s.sync()  # single flush on close
 
     def _load_settings(self):
+        # slurp every stored key once, then index the snapshot
         s = self.settings
-        self.ua_use_browser.setChecked(s.value("ua_use_browser", True, bool))
-        self.ua_edit.setText(s.value("ua_edit", ""))
+        vals = {k: s.value(k) for k in s.childKeys()}
+
+        def as_bool(key: str, default: bool) -> bool:
+            v = vals.get(key, default)
+            return v if isinstance(v, bool) else str(v).lower() in ("true", "1")
+
+        self.ua_use_browser.setChecked(as_bool("ua_use_browser", True))
+        self.ua_edit.setText(vals.get("ua_edit", ""))
         self.ua_edit.setEnabled(not self.ua_use_browser.isChecked())
-        self.cookies_file_edit.setText(s.value("cookies", ""))
-        self.output_dir_edit.setText(s.value("outdir", ""))
-        val = s.value("filter_combo", "Both")
+        self.cookies_file_edit.setText(vals.get("cookies", ""))
+        self.output_dir_edit.setText(vals.get("outdir", ""))
+        val = vals.get("filter_combo", "Both")
         idx = max(0, ["Both","Images","Videos"].index(val) if val in ["Both","Images","Videos"] else 0)
         self.filter_combo.setCurrentIndex(idx)
-        self.retries_spin.setValue(int(s.value("retries", 3)))
-        self.timeout_spin.setValue(int(s.value("timeout", 30)))
-        self.sleep_spin.setValue(int(s.value("sleep", 1)))
-        adv_open = s.value("adv_open", False, bool)
+        self.retries_spin.setValue(int(vals.get("retries", 3)))
+        self.timeout_spin.setValue(int(vals.get("timeout", 30)))
+        self.sleep_spin.setValue(int(vals.get("sleep", 1)))
+        adv_open = as_bool("adv_open", False)
         self.adv_toggle_btn.setChecked(adv_open)
         self._toggle_advanced()
-        g = s.value("geom")
+        self._last_update_check = float(vals.get("last_update_check_ts", 0.0))
+        g = vals.get("geom")
         if g:
             self.restoreGeometry(g)
         self._update_summary_labels(0, 0)
 
     def closeEvent(self, e):
         self._save_settings()
+        self._parser_thread.quit()
+        self._parser_thread.wait()
         super().closeEvent(e)
 
     # ---------- Update logic ----------
@@ -467,14 +756,26 @@ class Navillera(QWidget):
             return
         self._last_update_check = now
         self.settings.setValue("last_update_check_ts", self._last_update_check)
+        self.probe_local_version(self._check_update_against)
+
+    def _check_update_against(self, local: str | None, timed_out: bool):
+        if timed_out:
+            # unknown is not outdated; don't offer a redownload on a slow start
+            self._log("Update check skipped: the local version could not be read in time.")
+            self._last_update_check = 0.0  # retry on the next run instead of in 6 h
+            self.settings.setValue("last_update_check_ts", self._last_update_check)
+            return
+        self.request_latest_tag(lambda latest: self._on_latest_tag(local, latest))
 
-        local = get_local_version(self.bin_path)
-        latest = get_latest_version_tag()
+    def _on_latest_tag(self, local: str | None, latest: str | None):
         if latest is None:
             self._log("Update check: could not reach GitHub (offline or rate-limited). Will try again later.")
             return
 
-        if latest and local and is_newer(local, latest):
+        if latest and self._running:
+            # the check finished mid-run; don't swap the binary under a live batch
+            self._log(f"Latest gallery-dl upstream: {latest} (installed: {local or 'unknown'}).")
+        elif latest and local and is_newer(local, latest):
             btn = QMessageBox.question(
                 self, "Update available",
                 f"gallery-dl {local} is installed.\nA newer version {latest} is available.\n\nUpdate now?",
@@ -496,44 +797,175 @@ class Navillera(QWidget):
             else:
                 self._log(f"Latest gallery-dl upstream: {latest}")
 
+    # ---------- Network ----------
+    def _net_request(self, url: str, timeout_ms: int) -> QNetworkRequest:
+        req = QNetworkRequest(QUrl(url))
+        req.setHeader(QNetworkRequest.UserAgentHeader, f"{APP_NAME} (PySide6)")
+        req.setTransferTimeout(timeout_ms)
+        return req
+
+    def request_latest_tag(self, callback):
+        """Call callback(tag | None) with the latest upstream release tag.
+
+        A cached tag younger than 6 hours is returned straight away; otherwise
+        the API is revalidated with If-None-Match and a 304 only refreshes the
+        cache timestamp.
+        """
+        cache = load_gh_cache(self.settings)
+        if cache.get("tag") and (time.time() - float(cache.get("ts", 0))) < _GH_CACHE_TTL:
+            callback(cache["tag"])
+            return
+
+        req = self._net_request(_GH_LATEST_URL, 10000)
+        req.setRawHeader(b"Accept", b"application/vnd.github+json")
+        if cache.get("etag"):
+            req.setRawHeader(b"If-None-Match", cache["etag"].encode())
+        reply = self.net.get(req)
+
+        def _done():
+            reply.deleteLater()
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if status == 304 and cache.get("tag"):
+                tag, etag = cache["tag"], cache.get("etag")
+            elif reply.error() != QNetworkReply.NoError:
+                callback(None)
+                return
+            else:
+                tag = parse_release_tag(reply.readAll().data())
+                etag = reply.rawHeader(b"ETag").data().decode() or None
+            if tag:
+                store_gh_cache(self.settings, etag, tag)
+            callback(tag)
+
+        reply.finished.connect(_done)
+
+    def _rank_candidates(self, candidates, callback, timeout_ms: int = 5000):
+        """Race HEAD requests against all mirrors, then call callback(ordered).
+
+        The first mirror to answer 200 with a Content-Length moves to the front;
+        the order is unchanged if none answer within the timeout.
+        """
+        candidates = list(candidates)
+        if len(candidates) < 2:
+            callback(candidates)
+            return
+        replies = []
+        settled = False
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+
+        def _settle(order):
+            nonlocal settled
+            if settled:
+                return
+            settled = True
+            timer.stop()
+            timer.deleteLater()
+            for r in replies:
+                if r.isRunning():
+                    r.abort()
+                r.deleteLater()
+            callback(order)
+
+        def _probed(i, reply):
+            ok = (reply.error() == QNetworkReply.NoError
+                  and reply.attribute(QNetworkRequest.HttpStatusCodeAttribute) == 200
+                  and reply.hasRawHeader(b"Content-Length"))
+            if ok:
+                _settle([candidates[i]] + [c for j, c in enumerate(candidates) if j != i])
+            elif all(r.isFinished() for r in replies):
+                _settle(candidates)
+
+        for i, (url, _) in enumerate(candidates):
+            reply = self.net.head(self._net_request(url, timeout_ms))
+            reply.finished.connect(lambda i=i, reply=reply: _probed(i, reply))
+            replies.append(reply)
+        timer.timeout.connect(lambda: _settle(candidates))
+        timer.start(timeout_ms)
+
     # ---------- Fetch / Update ----------
     def fetch_binary(self):
-        latest = get_latest_version_tag()
-        local = get_local_version(self.bin_path) if self.bin_present() else None
+        if self._fetching:
+            return
+        self._fetching = True
+        self.fetch_btn.setEnabled(False)
+        self.probe_local_version(self._fetch_binary_over)
+
+    def _fetch_binary_over(self, local: str | None, timed_out: bool):
+        if timed_out:
+            # the binary is there but slow to answer; don't replace it blindly
+            self._log("Fetch skipped: the local version could not be read in time. Try again.")
+            self._end_fetch()
+            return
+        self.request_latest_tag(lambda latest: self._fetch_if_outdated(local, latest))
+
+    def _fetch_if_outdated(self, local: str | None, latest: str | None):
         if self.bin_present() and latest and local and not is_newer(local, latest):
             self._log(f"Binary already up to date (gallery-dl {local}). Skipping download.")
-            self.version_line.setText(f"gallery-dl {local}")
+            self._end_fetch()
+            return
+        # fastest responding mirror first; the rest remain as sequential fallbacks
+        self._rank_candidates(detect_asset_candidates(), self._download_next)
+
+    def _download_next(self, candidates, err_msgs=None):
+        err_msgs = [] if err_msgs is None else err_msgs
+        if not candidates:
+            self._end_fetch()
+            QMessageBox.critical(self, "Download failed", "Could not fetch gallery-dl.\n\n" + "\n".join(err_msgs))
+            return
+        (url, fname), rest = candidates[0], candidates[1:]
+        self._log(f"Trying: {url}")
+
+        def _fail(err):
+            msg = f"Download failed from {url}: {err}"
+            err_msgs.append(msg)
+            self._log(msg)
+            self._download_next(rest, err_msgs)
+
+        dest = app_bin_dir() / fname
+        tmp = dest.with_suffix(".tmp")
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp, "wb")
+        except OSError as e:
+            _fail(e)
             return
+        reply = self.net.get(self._net_request(url, 25000))
 
-        dest_dir = app_bin_dir()
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        def _read():
+            # streamed straight to disk as chunks arrive
+            f.write(reply.readAll().data())
 
-        ok = False
-        err_msgs = []
-        for url, fname in detect_asset_candidates():
-            self._log(f"Trying: {url}")
+        def _done():
+            _read()
+            f.close()
+            reply.deleteLater()
             try:
-                dest = dest_dir / fname
-                download_file(url, dest, expected_sha256=None, timeout=25)
+                if reply.error() != QNetworkReply.NoError:
+                    raise OSError(reply.errorString())
+                tmp.replace(dest)
                 make_executable(dest)
-                self._log(f"Saved: {dest}")
-                self.bin_path = dest
-                ok = True
-                break
             except Exception as e:
-                msg = f"Download failed from {url}: {e}"
-                err_msgs.append(msg)
-                self._log(msg)
-
-        if not ok:
-            QMessageBox.critical(self, "Download failed", "Could not fetch gallery-dl.\n\n" + "\n".join(err_msgs))
-        else:
+                tmp.unlink(missing_ok=True)
+                _fail(e)
+                return
+            self._log(f"Saved: {dest}")
+            self.bin_path = dest
+            self._local_ver_cache = None
+            self._end_fetch()
             self._log("Fetch complete.")
             if platform.system().lower() == "darwin":
                 self._log("macOS: If you see a quarantine warning, open Terminal and run:\n"
                           "xattr -d com.apple.quarantine \"{bin}\"\nThen re-run.".format(bin=str(self.bin_path)))
             self.show_version_if_present()
 
+        reply.readyRead.connect(_read)
+        reply.finished.connect(_done)
+
+    def _end_fetch(self):
+        self._fetching = False
+        self.fetch_btn.setEnabled(True)
+
     def _run_once(self, args, capture_only=False):
         if not self.bin_present():
             return ""
@@ -550,42 +982,58 @@ class Navillera(QWidget):
         p.finished.connect(lambda: None)
         p.start()
         p.waitForFinished(20000)
-        out = "".join(captured).strip()
-        if "--version" in args and out:
-            self.version_line.setText(out)
-            self._log(out)
-        return out
+        return "".join(captured).strip()
 
     # ---------- URL Handling ----------
     def _clean_urls(self, text: str) -> list[str]:
-        lines = [ln.strip() for ln in text.splitlines()]
-        out = []
-        skipped = 0
-        for ln in lines:
-            if not ln:
-                continue
-            if ln.startswith("<") and ln.endswith(">"):
-                ln = ln[1:-1].strip()
-            p = urlparse(ln)
-            if p.scheme in ("http", "https") and p.netloc:
-                out.append(ln)
-            else:
-                skipped += 1
+        return self._report_cleaned(_clean_test_urls(text))
+
+    def _report_cleaned(self, cleaned: tuple[tuple[str, ...], int, int]) -> list[str]:
+        urls, skipped, dups = cleaned
         if skipped:
             self._log(f"Skipped {skipped} non-URL line(s).")
-        return out
+        if dups:
+            self._log(f"Removed {dups} duplicate URL(s).")
+        return list(urls)
+
+    def _on_urls_changed(self):
+        self._url_cache = None
+        self._url_timer.start()
+
+    def _refresh_url_cache(self):
+        self._url_cache = clean_urls(self.urls.toPlainText())
+
+    def _append_urls(self, lines):
+        """Append lines to the URL box as one undoable edit, without rebuilding it."""
+        text = "\n".join(lines)
+        if not text:
+            return
+        doc = self.urls.document()
+        if doc.lastBlock().text():
+            text = "\n" + text
+        # a multi-MB paste would otherwise be duplicated into the undo stack
+        bulk = len(text) > (1 << 20)
+        if bulk:
+            self.urls.setUndoRedoEnabled(False)
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        cursor.insertText(text)
+        cursor.endEditBlock()
+        if bulk:
+            self.urls.setUndoRedoEnabled(True)
 
     def load_txt(self):
         path, _ = QFileDialog.getOpenFileName(self, "Choose a .txt with URLs", "", "Text files (*.txt);;All files (*)")
         if not path:
             return
         try:
+            merged = dict.fromkeys(iter_stripped(self.urls.toPlainText().splitlines()))
+            before = len(merged)
             with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                new_lines = [ln.strip() for ln in f.readlines()]
-            existing = [ln.strip() for ln in self.urls.toPlainText().splitlines() if ln.strip()]
-            merged = existing + [ln for ln in new_lines if ln and ln not in existing]
-            self.urls.setPlainText("\n".join(merged))
-            self._log(f"Loaded {len(new_lines)} URL(s) from {os.path.basename(path)}")
+                merged.update(dict.fromkeys(iter_stripped(f)))
+            self._append_urls(itertools.islice(merged, before, None))
+            self._log(f"Loaded {len(merged) - before} new URL(s) from {os.path.basename(path)}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to read file:\n{e}")
 
@@ -597,23 +1045,23 @@ class Navillera(QWidget):
 
     def dropEvent(self, e):
         md = e.mimeData()
-        added = []
+        merged = dict.fromkeys(iter_stripped(self.urls.toPlainText().splitlines()))
+        before = len(merged)
         for u in md.urls():
             try:
                 if u.isLocalFile():
                     p = u.toLocalFile()
                     if p.lower().endswith(".txt"):
                         with open(p, "r", encoding="utf-8", errors="ignore") as f:
-                            added += [ln.strip() for ln in f if ln.strip()]
+                            merged.update(dict.fromkeys(iter_stripped(f)))
             except Exception as ex:
                 self._log(f"Failed to read dropped file: {ex}")
         if md.hasText():
-            added += [ln.strip() for ln in md.text().splitlines() if ln.strip()]
+            merged.update(dict.fromkeys(iter_stripped(md.text().splitlines())))
+        added = len(merged) - before
         if added:
-            existing = [ln.strip() for ln in self.urls.toPlainText().splitlines() if ln.strip()]
-            dedup = existing + [ln for ln in added if ln not in existing]
-            self.urls.setPlainText("\n".join(dedup))
-            self._log(f"Added {len(added)} URL(s) via drag-and-drop.")
+            self._append_urls(itertools.islice(merged, before, None))
+            self._log(f"Added {added} URL(s) via drag-and-drop.")
 
     # ---------- Cookies helpers ----------
     def pick_cookies_file(self):
@@ -709,170 +1157,155 @@ class Navillera(QWidget):
 
         self.maybe_check_update()
 
-        urls_raw = self._clean_urls(self.urls.toPlainText())
-        if not urls_raw:
+        if self._url_cache is None:
+            self._refresh_url_cache()
+        urls = self._report_cleaned(self._url_cache)
+        if not urls:
             QMessageBox.information(self, "No URLs",
                 "Add at least one http(s) URL (one per line), or drag a .txt list into the box.")
             return
 
-        # de-duplicate while preserving order
-        seen = set()
-        urls = []
-        for u in urls_raw:
-            if u not in seen:
-                urls.append(u)
-                seen.add(u)
-        if len(urls) != len(urls_raw):
-            self._log(f"Removed {len(urls_raw) - len(urls)} duplicate URL(s).")
-
-        if self.proc and self.proc.state() != QProcess.NotRunning:
+        if self._running:
             QMessageBox.information(self, "Running", "A job is already running.")
             return
 
+        self._running = True
         self.queue = urls
-        self._totals = {"downloaded": 0, "skipped": 0, "failed": 0}
-        self._seen_paths.clear()
+        self._t_downloaded = self._t_skipped = self._t_failed = 0
         self._error_lines = 0
         self.run_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
         # Build safe batches to avoid Windows 32k command line limit
-        self._batches = self._build_batches(urls, base_args_len=len(" ".join(self._build_common_args())))
+        self._common_args = self._build_common_args()
+        base_args_len = sum(len(a) + 1 for a in self._common_args)
+        starts = self._batch_starts(urls, base_args_len=base_args_len)
+        self._batch_iter = (urls[i:j] for i, j in zip(starts, starts[1:] + [len(urls)]))
         self._batch_index = -1
+        self._done_urls_prior = 0
+        self._queue_total = len(self.queue)
+        self._total_batches = len(starts)
 
         # show 0/N immediately
-        self._update_summary_labels(0, len(self.queue))
+        self._update_summary_labels(0, self._queue_total)
 
-        self._log(f"Queued {len(self.queue)} URL(s) in {len(self._batches)} batch(es).")
+        self._log(f"Queued {self._queue_total} URL(s) in {self._total_batches} batch(es).")
         self._run_next_batch()
 
-    def _build_batches(self, urls: list[str], base_args_len: int, max_cmd_len: int = 30000) -> list[list[str]]:
-        batches = []
-        cur = []
-        cur_len = base_args_len
-        for u in urls:
-            add = len(u) + 1  # space
-            if cur and (cur_len + add) > max_cmd_len:
-                batches.append(cur)
-                cur = [u]
-                cur_len = base_args_len + len(u)
-            else:
-                cur.append(u)
-                cur_len += add
-        if cur:
-            batches.append(cur)
-        return batches
+    def _batch_starts(self, urls: list[str], base_args_len: int, max_cmd_len: int = 30000) -> list[int]:
+        """Index of the first URL of each batch that fits within max_cmd_len."""
+        budget = max_cmd_len - base_args_len
+        lens = [len(u) + 1 for u in urls]  # +1 for the separating space
+
+        # running command length that restarts at each URL that would overflow it;
+        # wherever the running total equals the URL's own length a new batch begins
+        def step(run: int, add: int) -> int:
+            return add if run + add > budget else run + add
+
+        runs = itertools.accumulate(lens, step)
+        return [i for i, (run, add) in enumerate(zip(runs, lens)) if run == add]
 
     def _run_next_batch(self):
         self._batch_index += 1
-        total_batches = len(self._batches)
-        if self._batch_index >= total_batches:
+        batch = next(self._batch_iter, None)
+        if batch is None:
+            self._batch_urls = []
             self._log("All done.")
+            self._running = False
             self.run_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
-            self._update_summary_labels(len(self.queue), len(self.queue))
+            self._update_summary_labels(self._queue_total, self._queue_total)
             return
 
         # prepare batch
-        self._batch_urls = self._batches[self._batch_index]
-        self._batch_started_at = time.time()
-        self._seen_paths.clear()
+        self._batch_urls = batch
+        self._batch_token += 1
+        self._parse_reset.emit()
         self._error_lines = 0
 
         # launch single process with [URLs...]
-        args = self._build_common_args() + self._batch_urls
+        args = self._common_args + self._batch_urls
         self.proc = QProcess(self)
         self.proc.setProgram(str(self.bin_path))
         self.proc.setArguments(args)
+        # merged, so gallery-dl's stderr warnings stay in order with its paths
         self.proc.setProcessChannelMode(QProcess.MergedChannels)
-        self.proc.readyReadStandardOutput.connect(self._read_output)
+        self.proc.readyReadStandardOutput.connect(self._schedule_read)
         self.proc.finished.connect(self._finished_batch)
-        self._log(f"=== Batch {self._batch_index+1}/{total_batches} — {len(self._batch_urls)} URL(s) ===")
+        self._log(f"=== Batch {self._batch_index+1}/{self._total_batches} — {len(self._batch_urls)} URL(s) ===")
         self.proc.start()
 
     def stop_run(self):
+        self._read_timer.stop()
         if self.proc and self.proc.state() != QProcess.NotRunning:
+            # a kill may only land after we return; its batch is over either way
+            self.proc.finished.disconnect(self._finished_batch)
             self.proc.terminate()
             if not self.proc.waitForFinished(1500):
                 self.proc.kill()
             self._log("Stopped by user.")
+        self.proc = None
+        self._running = False
         self.queue = []
-        self._batches = []
+        self._batch_iter = iter(())
+        self._batch_token += 1  # anything still in the parser is for a stopped run
+        self._queue_total = self._total_batches = 0
         self.run_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self._update_summary_labels(0, 0)
 
+    def _schedule_read(self):
+        if not self._read_timer.isActive():
+            self._read_timer.start()
+
     def _read_output(self):
         if not self.proc:
             return
-        data = self.proc.readAllStandardOutput().data().decode(errors="replace")
+        data = self.proc.readAllStandardOutput().data()
         if not data:
             return
 
-        at_end = self.log.verticalScrollBar().value() == self.log.verticalScrollBar().maximum()
-        self._log(data.rstrip("\n"))
-        if at_end:
-            self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
-
-        # --- Live classification ---
-        file_re = re.compile(r"""
-            (?:[A-Za-z]:\\[^:*?"<>|\r\n]+|/[^:*?"<>|\r\n]+)
-            \.(?:jpe?g|png|gif|webp|mp4|webm|mkv|mov|avi)\b
-        """, re.IGNORECASE | re.VERBOSE)
-
-        for raw in data.splitlines():
-            line = raw.strip()
-            low = line.lower()
-
-            # Count likely errors live
-            if ("error:" in low) or ("http error" in low) or ("forbidden" in low) or ("not found" in low):
-                self._error_lines += 1
-                self._totals["failed"] += 1
-                done_urls = sum(len(b) for b in self._batches[: self._batch_index])  # finished batches so far
-                self._update_summary_labels(done_urls, len(self.queue))
-                continue
+        # one decode per chunk, for display only
+        self._log(data.decode(errors="replace").rstrip("\n"))
 
-            # Printed path -> downloaded or skipped (based on mtime vs batch start)
-            m = file_re.search(line)
-            if not m:
-                continue
-            path = m.group(0)
-            if path in self._seen_paths:
-                continue
-            self._seen_paths.add(path)
+        # classified on the parser thread; deltas come back via _on_parsed
+        self._parse_requested.emit(self._batch_token, data)
 
-            try:
-                st = os.stat(path)
-                if st.st_mtime < (self._batch_started_at + 0.5):
-                    self._totals["skipped"] += 1
-                else:
-                    self._totals["downloaded"] += 1
-            except FileNotFoundError:
-                # Assume downloaded; if not, it won't get double-counted later anyway
-                self._totals["downloaded"] += 1
-            except Exception:
-                self._totals["skipped"] += 1
-
-            done_urls = sum(len(b) for b in self._batches[: self._batch_index])
-            self._update_summary_labels(done_urls, len(self.queue))
+    def _on_parsed(self, batch: int, downloaded: int, skipped: int, failed: int):
+        if batch != self._batch_token:
+            return  # from a batch of a stopped or earlier run
+        self._error_lines += failed
+        self._t_downloaded += downloaded
+        self._t_skipped += skipped
+        self._t_failed += failed
+        self._update_summary_labels(self._done_urls_prior, self._queue_total)
 
     def _finished_batch(self):
+        # drain whatever the coalescing timer hasn't picked up yet; it is queued
+        # to the parser ahead of the finish() below, so the totals include it
+        self._read_timer.stop()
+        self._read_output()
         code = self.proc.exitCode() if self.proc else 0
         if code != 0:
-            self._totals["failed"] += 1
+            self._t_failed += 1
             self._log(f"❌ Batch failed (exit code {code})")
 
         # mark progress by URL count in this batch
-        done_urls = sum(len(b) for b in self._batches[: self._batch_index + 1])
-        self._update_summary_labels(done_urls, len(self.queue))
+        self._update_summary_labels(self._done_urls_prior + len(self._batch_urls), self._queue_total)
 
         # reset for next batch
+        self._done_urls_prior += len(self._batch_urls)
         self.proc = None
-        self._seen_paths.clear()
-        self._error_lines = 0
 
+        # totals are reported once the parser has caught up with this batch
+        self._parse_finish.emit(self._batch_token)
+
+    def _on_batch_done(self, batch: int):
+        if batch != self._batch_token:
+            return  # the run was stopped meanwhile
+        self._error_lines = 0
         self._log(f"✅ Batch {self._batch_index+1} done — totals: "
-                  f"downloaded={self._totals['downloaded']} • skipped={self._totals['skipped']} • failed={self._totals['failed']}")
+                  f"downloaded={self._t_downloaded} • skipped={self._t_skipped} • failed={self._t_failed}")
         self._run_next_batch()
 
     # ---------- Test URL (dry run) ----------